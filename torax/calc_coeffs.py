@@ -49,8 +49,12 @@ def calculate_pereverzev_flux(
       core_profiles.ni.face_value() * dynamic_runtime_params_slice.numerics.nref
   )
 
-  geo_factor = jnp.concatenate(
-      [jnp.ones(1), geo.g1_over_vpr_face[1:] / geo.g0_face[1:]]
+  # unity on-axis, masking the on-axis denominator to avoid div by zero
+  on_axis = jnp.arange(geo.g0_face.shape[0]) == 0
+  geo_factor = jnp.where(
+      on_axis,
+      1.0,
+      geo.g1_over_vpr_face / jnp.where(on_axis, 1.0, geo.g0_face),
   )
 
   chi_face_per_ion = (
@@ -15,9 +15,12 @@
 """Functions to build sim.Sim objects, which are used to run TORAX."""
 
 import copy
+import functools
+import os
 from typing import Any
 
 from torax import geometry
+from torax import geometry_loader
 from torax import geometry_provider
 from torax import sim as sim_lib
 from torax.config import config_args
@@ -74,8 +77,45 @@ def build_chease_geometry(
       calculations.
 
   Returns:
-    A constructed Chease `StandardGeometry` object.
+    A constructed Chease `StandardGeometry` object. Calls with the same
+    arguments (after resolving `geometry_dir`) and an unmodified CHEASE file
+    return the same cached instance, whose arrays are read-only.
   """
+  # Resolve the directory before hitting the cache, so that the cache is keyed
+  # on the actual file path rather than on geometry_dir=None. The file's
+  # modification time is part of the key, so a rewritten file is reloaded.
+  geometry_dir = geometry_loader.get_geometry_dir(geometry_dir)
+  file_mtime_ns = os.stat(os.path.join(geometry_dir, geometry_file)).st_mtime_ns
+  return _build_chease_geometry_cached(
+      Ip_from_parameters=Ip_from_parameters,
+      geometry_dir=geometry_dir,
+      geometry_file=geometry_file,
+      file_mtime_ns=file_mtime_ns,
+      nr=nr,
+      Rmaj=Rmaj,
+      Rmin=Rmin,
+      B0=B0,
+      hires_fac=hires_fac,
+  )
+
+
+# Memoized to avoid re-reading the CHEASE file and rebuilding the geometry when
+# the same geometry is requested repeatedly (e.g. in parameter sweeps). Callers
+# share the returned instance, so its arrays are made read-only.
+@functools.lru_cache(maxsize=32)
+def _build_chease_geometry_cached(
+    Ip_from_parameters: bool,
+    geometry_dir: str,
+    geometry_file: str,
+    file_mtime_ns: int,
+    nr: int,
+    Rmaj: float,
+    Rmin: float,
+    B0: float,
+    hires_fac: int,
+) -> geometry.StandardGeometry:
+  """Cached implementation of `build_chease_geometry`."""
+  del file_mtime_ns  # Only used as part of the cache key.
   intermediates = geometry.StandardGeometryIntermediates.from_chease(
       geometry_dir=geometry_dir,
       geometry_file=geometry_file,
@@ -87,7 +127,7 @@ def build_chease_geometry(
       hires_fac=hires_fac,
   )
   geo = geometry.build_standard_geometry(intermediates)
-  return geo
+  return geometry.set_arrays_read_only(geo)
 
 
 def build_chease_geometry_provider(
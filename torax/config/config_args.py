@@ -24,6 +24,7 @@ from typing import Any
 from typing import TypeVar
 
 import chex
+from jax import numpy as jnp
 from torax import geometry
 from torax import interpolated_param
 
@@ -88,6 +89,12 @@ def _interpolate_var_single_axis(
     t: chex.Numeric,
 ) -> chex.Array:
   """Interpolates the input param at time t."""
+  # Constant inputs don't need an interpolator built at every call. These match
+  # what InterpolatedVarSingleAxis.get_value returns for them.
+  if isinstance(param_or_param_input, bool):
+    return jnp.bool_(param_or_param_input)
+  if isinstance(param_or_param_input, (int, float)):
+    return jnp.array(param_or_param_input, dtype=jnp.result_type(float))
   if not isinstance(
       param_or_param_input, interpolated_param.InterpolatedVarSingleAxis
   ):
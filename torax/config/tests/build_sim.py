@@ -14,10 +14,14 @@
 
 """Unit tests for torax.config.build_sim."""
 
+import os
+import shutil
+
 from absl.testing import absltest
 from absl.testing import parameterized
 import numpy as np
 from torax import geometry
+from torax import geometry_loader
 from torax import geometry_provider
 from torax.config import build_sim
 from torax.config import runtime_params as runtime_params_lib
@@ -202,6 +206,32 @@ class BuildSimTest(parameterized.TestCase):
     self.assertIsInstance(geo_provider(t=0), geometry.StandardGeometry)
     np.testing.assert_array_equal(geo_provider.torax_mesh.nx, 5)
 
+  def test_chease_geometry_is_cached(self):
+    """Tests that building the same chease geometry twice reuses the result."""
+    geo_0 = build_sim.build_chease_geometry(nr=5)
+    geo_1 = build_sim.build_chease_geometry(nr=5)
+    geo_2 = build_sim.build_chease_geometry(nr=5, Rmaj=7.0)
+    self.assertIs(geo_0, geo_1)
+    self.assertIsNot(geo_0, geo_2)
+    # The cached arrays are shared, so they must not be writable.
+    with self.assertRaises(ValueError):
+      geo_0.vpr[0] = 1.0
+
+  def test_chease_geometry_cache_is_invalidated_by_file_change(self):
+    """Tests that a modified chease file is reloaded rather than cached."""
+    geometry_file = 'ITER_hybrid_citrin_equil_cheasedata.mat2cols'
+    geometry_dir = self.create_tempdir().full_path
+    path = os.path.join(geometry_dir, geometry_file)
+    shutil.copyfile(
+        os.path.join(geometry_loader.get_geometry_dir(None), geometry_file),
+        path,
+    )
+    geo_0 = build_sim.build_chease_geometry(geometry_dir=geometry_dir, nr=5)
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    geo_1 = build_sim.build_chease_geometry(geometry_dir=geometry_dir, nr=5)
+    self.assertIsNot(geo_0, geo_1)
+
   # pylint: disable=invalid-name
   def test_chease_geometry_updates_Ip(self):
     """Tests that the Ip is updated when using chease geometry."""
@@ -20,13 +20,13 @@ from collections.abc import Mapping
 import dataclasses
 import enum
 import functools
+import math
 from typing import Type
 
 import chex
 import jax
 import jax.numpy as jnp
 import numpy as np
-import scipy
 from torax import constants
 from torax import geometry_loader
 from torax import interpolated_param
@@ -86,8 +86,8 @@ class Grid1D:
     return Grid1D(
         nx=nx,
         dx=dx,
-        face_centers=np.linspace(0, nx * dx, nx + 1),
-        cell_centers=np.linspace(dx * 0.5, (nx - 0.5) * dx, nx),
+        face_centers=np.arange(nx + 1) * dx,
+        cell_centers=(np.arange(nx) + 0.5) * dx,
     )
 
 
@@ -106,6 +106,27 @@ def face_to_cell(face: chex.Array) -> chex.Array:
   return 0.5 * (face[:-1] + face[1:])
 
 
+def _face_ratio_with_axis_value(
+    numerator: chex.Array, denominator: chex.Array, axis_value: float
+) -> jax.Array:
+  """Returns numerator / denominator, replaced by `axis_value` on-axis.
+
+  The on-axis denominator is masked before dividing, to avoid div by zero
+  (and NaN gradients) on-axis.
+
+  Args:
+    numerator: Face array.
+    denominator: Face array, which may be zero on-axis.
+    axis_value: Value of the ratio on-axis.
+
+  Returns:
+    The face array numerator / denominator with the on-axis value set.
+  """
+  on_axis = jnp.arange(numerator.shape[0]) == 0
+  safe_denominator = jnp.where(on_axis, 1.0, denominator)
+  return jnp.where(on_axis, axis_value, numerator / safe_denominator)
+
+
 @enum.unique
 class GeometryType(enum.Enum):
   """Integer enum for geometry type.
@@ -165,11 +186,8 @@ class Geometry:
   Rin_face: chex.Array
   Rout: chex.Array
   Rout_face: chex.Array
-  volume_hires: chex.Array
-  area_hires: chex.Array
   spr_hires: chex.Array
   r_hires_norm: chex.Array
-  r_hires: chex.Array
   vpr_hires: chex.Array
   Phibdot: chex.Array
 
@@ -189,6 +207,10 @@ class Geometry:
   def r(self) -> chex.Array:
     return self.r_norm * self.rmax
 
+  @property
+  def r_hires(self) -> chex.Array:
+    return self.r_hires_norm * self.rmax
+
   @property
   def dr(self) -> chex.Array:
     return self.dr_norm * self.rmax
@@ -208,71 +230,52 @@ class Geometry:
 
   @property
   def g0_over_vpr_face(self) -> jax.Array:
-    return jnp.concatenate((
-        jnp.ones(1),  # correct value is unity on-axis
-        self.g0_face[1:] / self.vpr_face[1:],  # avoid div by zero on-axis
-    ))
+    # correct value is unity on-axis
+    return _face_ratio_with_axis_value(self.g0_face, self.vpr_face, 1.0)
 
   @property
   def g1_over_vpr_face(self) -> jax.Array:
-    return jnp.concatenate((
-        jnp.zeros(1),  # correct value is zero on-axis
-        self.g1_face[1:] / self.vpr_face[1:],  # avoid div by zero on-axis
-    ))
+    # correct value is zero on-axis
+    return _face_ratio_with_axis_value(self.g1_face, self.vpr_face, 0.0)
 
   @property
   def g1_over_vpr2_face(self) -> jax.Array:
-    return jnp.concatenate((
-        jnp.ones(1),  # correct value is unity on-axis
-        self.g1_face[1:] / self.vpr_face[1:] ** 2,  # avoid div by zero on-axis
-    ))
+    # correct value is unity on-axis
+    return _face_ratio_with_axis_value(self.g1_face, self.vpr_face**2, 1.0)
+
+
+# Geometry attributes which are not interpolated in time by GeometryProvider.
+_NON_INTERPOLATED_GEOMETRY_ATTRIBUTES = frozenset(
+    ('geometry_type', 'torax_mesh', 'Ip_from_parameters', 'Phibdot')
+)
 
 
 @chex.dataclass(frozen=True)
 class GeometryProvider:
-  """A geometry which holds variables to interpolated based on time."""
+  """A geometry which holds variables to interpolated based on time.
+
+  Rather than holding one interpolated variable per geometry attribute, all
+  time-varying attributes are flattened and packed side by side into a single
+  2-D array of shape (num_times, total_size). A single (vmapped) interpolation
+  in time then provides every attribute at once, and `packed_layout` is used to
+  split the result back into the named attributes.
+
+  Attributes:
+    geometry_type: See `Geometry.geometry_type`.
+    torax_mesh: See `Geometry.torax_mesh`. Must be the same for all times.
+    packed_values: Interpolated variable over the packed attributes.
+    packed_layout: Tuple of (attribute name, shape) pairs, in the order in which
+      the attributes are packed in `packed_values`.
+  """
   geometry_type: int
   torax_mesh: Grid1D
-  dr_norm: interpolated_param.InterpolatedVarSingleAxis
-  rmax: interpolated_param.InterpolatedVarSingleAxis
-  Rmaj: interpolated_param.InterpolatedVarSingleAxis
-  Rmin: interpolated_param.InterpolatedVarSingleAxis
-  B0: interpolated_param.InterpolatedVarSingleAxis
-  volume: interpolated_param.InterpolatedVarSingleAxis
-  volume_face: interpolated_param.InterpolatedVarSingleAxis
-  area: interpolated_param.InterpolatedVarSingleAxis
-  area_face: interpolated_param.InterpolatedVarSingleAxis
-  vpr: interpolated_param.InterpolatedVarSingleAxis
-  vpr_face: interpolated_param.InterpolatedVarSingleAxis
-  spr_cell: interpolated_param.InterpolatedVarSingleAxis
-  spr_face: interpolated_param.InterpolatedVarSingleAxis
-  delta_face: interpolated_param.InterpolatedVarSingleAxis
-  g0: interpolated_param.InterpolatedVarSingleAxis
-  g0_face: interpolated_param.InterpolatedVarSingleAxis
-  g1: interpolated_param.InterpolatedVarSingleAxis
-  g1_face: interpolated_param.InterpolatedVarSingleAxis
-  g2: interpolated_param.InterpolatedVarSingleAxis
-  g2_face: interpolated_param.InterpolatedVarSingleAxis
-  g3: interpolated_param.InterpolatedVarSingleAxis
-  g3_face: interpolated_param.InterpolatedVarSingleAxis
-  g2g3_over_rho: interpolated_param.InterpolatedVarSingleAxis
-  g2g3_over_rho_face: interpolated_param.InterpolatedVarSingleAxis
-  g2g3_over_rho_hires: interpolated_param.InterpolatedVarSingleAxis
-  J: interpolated_param.InterpolatedVarSingleAxis
-  J_face: interpolated_param.InterpolatedVarSingleAxis
-  J_hires: interpolated_param.InterpolatedVarSingleAxis
-  F: interpolated_param.InterpolatedVarSingleAxis
-  F_face: interpolated_param.InterpolatedVarSingleAxis
-  Rin: interpolated_param.InterpolatedVarSingleAxis
-  Rin_face: interpolated_param.InterpolatedVarSingleAxis
-  Rout: interpolated_param.InterpolatedVarSingleAxis
-  Rout_face: interpolated_param.InterpolatedVarSingleAxis
-  volume_hires: interpolated_param.InterpolatedVarSingleAxis
-  area_hires: interpolated_param.InterpolatedVarSingleAxis
-  spr_hires: interpolated_param.InterpolatedVarSingleAxis
-  r_hires_norm: interpolated_param.InterpolatedVarSingleAxis
-  r_hires: interpolated_param.InterpolatedVarSingleAxis
-  vpr_hires: interpolated_param.InterpolatedVarSingleAxis
+  packed_values: interpolated_param.InterpolatedVarSingleAxis
+  packed_layout: tuple[tuple[str, tuple[int, ...]], ...]
+
+  @classmethod
+  def geometry_class(cls) -> Type[Geometry]:
+    """Returns the type of Geometry built by this provider."""
+    return Geometry
 
   @classmethod
   def create_provider(
@@ -288,23 +291,33 @@ class GeometryProvider:
         raise ValueError('All geometries must have the same geometry type.')
       if geometry.torax_mesh != initial_geometry.torax_mesh:
         raise ValueError('All geometries must have the same mesh.')
-    # Create a list of interpolated parameters for each geometry attribute.
     kwargs = {
         'geometry_type': initial_geometry.geometry_type,
         'torax_mesh': initial_geometry.torax_mesh,
     }
     if hasattr(initial_geometry, 'Ip_from_parameters'):
       kwargs['Ip_from_parameters'] = initial_geometry.Ip_from_parameters
-    for attr in dataclasses.fields(cls):
-      if (
-          attr.name == 'geometry_type'
-          or attr.name == 'torax_mesh'
-          or attr.name == 'Ip_from_parameters'
-      ):
-        continue
-      kwargs[attr.name] = interpolated_param.InterpolatedVarSingleAxis(
-          (times, np.stack([getattr(g, attr.name) for g in geos], axis=0))
-      )
+    # Pack all time-varying attributes of each geometry into one flat row. Only
+    # the attributes of the geometry type built by this provider are packed,
+    # which may be fewer than those of the given geometries.
+    packed_layout = tuple(
+        (attr.name, np.shape(getattr(initial_geometry, attr.name)))
+        for attr in dataclasses.fields(cls.geometry_class())
+        if attr.name not in _NON_INTERPOLATED_GEOMETRY_ATTRIBUTES
+    )
+    packed_values = np.stack(
+        [
+            np.concatenate(
+                [np.ravel(getattr(g, name)) for name, _ in packed_layout]
+            )
+            for g in geos
+        ],
+        axis=0,
+    )
+    kwargs['packed_values'] = interpolated_param.InterpolatedVarSingleAxis(
+        (times, packed_values)
+    )
+    kwargs['packed_layout'] = packed_layout
     return cls(**kwargs)
 
   def _get_geometry_base(self, t: chex.Numeric, geometry_class: Type[Geometry]):
@@ -315,26 +328,22 @@ class GeometryProvider:
     }
     if hasattr(self, 'Ip_from_parameters'):
       kwargs['Ip_from_parameters'] = self.Ip_from_parameters
-    for attr in dataclasses.fields(geometry_class):
-      if (
-          attr.name == 'geometry_type'
-          or attr.name == 'torax_mesh'
-          or attr.name == 'Ip_from_parameters'
-      ):
-        continue
-      # always initialize Phibdot as zero. It will be replaced once both geo_t
-      # and geo_t_plus_dt are provided, and set to be the same for geo_t and
-      # geo_t_plus_dt for each given time interval.
-      if attr.name == 'Phibdot':
-        kwargs[attr.name] = 0.0
-        continue
-      kwargs[attr.name] = getattr(self, attr.name).get_value(t)
+    packed_values = self.packed_values.get_value(t)
+    offset = 0
+    for name, shape in self.packed_layout:
+      size = math.prod(shape)
+      kwargs[name] = packed_values[offset : offset + size].reshape(shape)
+      offset += size
+    # always initialize Phibdot as zero. It will be replaced once both geo_t
+    # and geo_t_plus_dt are provided, and set to be the same for geo_t and
+    # geo_t_plus_dt for each given time interval.
+    kwargs['Phibdot'] = 0.0
     return geometry_class(**kwargs)  # pytype: disable=wrong-keyword-args
 
   @functools.partial(jax_utils.jit, static_argnums=0)
   def __call__(self, t: chex.Numeric) -> Geometry:
     """Returns a Geometry instance at the given time."""
-    return self._get_geometry_base(t, Geometry)
+    return self._get_geometry_base(t, self.geometry_class())
 
 
 @chex.dataclass(frozen=True)
@@ -355,13 +364,15 @@ class CircularAnalyticalGeometryProvider(GeometryProvider):
 
   Most users should default to using the GeometryProvider class.
   """
-  kappa: interpolated_param.InterpolatedVarSingleAxis
-  kappa_face: interpolated_param.InterpolatedVarSingleAxis
-  kappa_hires: interpolated_param.InterpolatedVarSingleAxis
+
+  @classmethod
+  def geometry_class(cls) -> Type[Geometry]:
+    """Returns the type of Geometry built by this provider."""
+    return CircularAnalyticalGeometry
 
   def __call__(self, t: chex.Numeric) -> Geometry:
     """Returns a Geometry instance at the given time."""
-    return self._get_geometry_base(t, CircularAnalyticalGeometry)
+    return self._get_geometry_base(t, self.geometry_class())
 
 
 @chex.dataclass(frozen=True)
@@ -384,20 +395,43 @@ class StandardGeometry(Geometry):
 class StandardGeometryProvider(GeometryProvider):
   """Values to be interpolated for a Standard Geometry."""
   Ip_from_parameters: bool
-  Ip: interpolated_param.InterpolatedVarSingleAxis
-  psi: interpolated_param.InterpolatedVarSingleAxis
-  psi_from_Ip: interpolated_param.InterpolatedVarSingleAxis
-  jtot: interpolated_param.InterpolatedVarSingleAxis
-  jtot_face: interpolated_param.InterpolatedVarSingleAxis
-  delta_upper_face: interpolated_param.InterpolatedVarSingleAxis
-  delta_lower_face: interpolated_param.InterpolatedVarSingleAxis
+
+  @classmethod
+  def geometry_class(cls) -> Type[Geometry]:
+    """Returns the type of Geometry built by this provider."""
+    return StandardGeometry
 
   @functools.partial(jax_utils.jit, static_argnums=0)
   def __call__(self, t: chex.Numeric) -> Geometry:
     """Returns a Geometry instance at the given time."""
-    return self._get_geometry_base(t, StandardGeometry)
+    return self._get_geometry_base(t, self.geometry_class())
+
+
+def set_arrays_read_only(geo: Geometry) -> Geometry:
+  """Marks all NumPy arrays held by `geo` as read-only and returns `geo`.
 
+  A frozen Geometry can't have its attributes reassigned, but the contents of
+  its NumPy arrays can still be changed in place. Geometries that are cached
+  and shared between callers are made read-only, so that such a change raises
+  instead of silently affecting every other caller.
+
+  Args:
+    geo: The geometry whose arrays are made read-only.
 
+  Returns:
+    The same geometry.
+  """
+  for leaf in jax.tree_util.tree_leaves(geo):
+    if isinstance(leaf, np.ndarray):
+      leaf.setflags(write=False)
+  return geo
+
+
+# Memoized since the circular geometry is a pure function of a few scalars and
+# is typically rebuilt with the same arguments (e.g. per geometry_configs entry
+# or per test). Callers share the returned instance, so its arrays are made
+# read-only.
+@functools.lru_cache(maxsize=32)
 def build_circular_geometry(
     nr: int = 25,
     kappa: float = 1.72,
@@ -413,6 +447,9 @@ def build_circular_geometry(
   overriding __init__ functions with different parameters than the attributes of
   the dataclass, so this builder function lives outside the class.
 
+  Calls with the same arguments return the same (cached) instance, whose arrays
+  are read-only.
+
   Args:
     nr: Radial grid points (num cells)
     kappa: Elogination. Defaults to 1.72 for the ITER elongation, to
@@ -455,24 +492,22 @@ def build_circular_geometry(
   area = np.pi * r**2 * kappa
   area_face = np.pi * r_face**2 * kappa_face
 
+  # V' = dV/dr = 2*pi^2*Rmaj*r*(2*kappa + r*dkappa/dr) and
+  # S' = dS/dr = pi*r*(2*kappa + r*dkappa/dr), in factored form, where the
+  # shared factor is d(r^2*kappa)/dr / r.
+  dkappa_dr = (kappa_param - 1) / rmax
+  dr2kappa_dr_over_r = 2 * kappa + r * dkappa_dr
+  dr2kappa_dr_over_r_face = 2 * kappa_face + r_face * dkappa_dr
+
   # V' for volume integrations
-  vpr = (
-      4 * np.pi**2 * Rmaj * r * kappa
-      + volume / kappa * (kappa_param - 1) / rmax
-  )
-  vpr_face = (
-      4 * np.pi**2 * Rmaj * r_face * kappa_face
-      + volume_face / kappa_face * (kappa_param - 1) / rmax
-  )
+  vpr = 2 * np.pi**2 * Rmaj * r * dr2kappa_dr_over_r
+  vpr_face = 2 * np.pi**2 * Rmaj * r_face * dr2kappa_dr_over_r_face
   # pylint: disable=invalid-name
   # S' for area integrals on cell grid
-  spr_cell = 2 * np.pi * r * kappa + area / kappa * (kappa_param - 1) / rmax
-  spr_face = (
-      2 * np.pi * r_face * kappa_face
-      + area_face / kappa_face * (kappa_param - 1) / rmax
-  )
+  spr_cell = np.pi * r * dr2kappa_dr_over_r
+  spr_face = np.pi * r_face * dr2kappa_dr_over_r_face
 
-  delta_face = np.zeros(len(r_face))
+  delta_face = np.zeros(nr + 1)
 
   # Geometry variables for general geometry form of transport equations.
   # With circular geometry approximation.
@@ -512,11 +547,11 @@ def build_circular_geometry(
   g3_face = 1 / (Rmaj**2 * (1 - (r_face / Rmaj) ** 2) ** (3.0 / 2.0))
 
   # simplifying assumption for now, for J=R*B/(R0*B0)
-  J = np.ones(len(r))
-  J_face = np.ones(len(r_face))
+  J = np.ones(nr)
+  J_face = np.ones(nr + 1)
   # simplified (constant) version of the F=B*R function
-  F = np.ones(len(r)) * Rmaj * B0
-  F_face = np.ones(len(r_face)) * Rmaj * B0
+  F = np.full(nr, Rmaj * B0)
+  F_face = np.full(nr + 1, Rmaj * B0)
 
   # Using an approximation where:
   # g2g3_over_rho = 16 * pi**4 * G2 / (J * R) where:
@@ -532,7 +567,12 @@ def build_circular_geometry(
   # High resolution versions for j (plasma current) and psi (poloidal flux)
   # manipulations. Needed if psi is initialized from plasma current, which is
   # the only option for ad-hoc circular geometry.
-  r_hires_norm = np.linspace(0, 1, nr * hires_fac)
+  # NOTE: the hires grid (nr * hires_fac points including both ends) does not
+  # contain the face grid as a strided subset, so it cannot be shared with the
+  # mesh without changing the hires grid itself. Build it directly from an
+  # integer range like the mesh, rather than via linspace.
+  nr_hires = nr * hires_fac
+  r_hires_norm = np.arange(nr_hires) / (nr_hires - 1)
   r_hires = r_hires_norm * rmax
 
   Rout = Rmaj + r
@@ -544,25 +584,28 @@ def build_circular_geometry(
   # assumed elongation profile on hires grid
   kappa_hires = 1 + r_hires_norm * (kappa_param - 1)
 
-  volume_hires = 2 * np.pi**2 * Rmaj * r_hires**2 * kappa_hires
-  area_hires = np.pi * r_hires**2 * kappa_hires
-
-  # V' for volume integrations on hires grid
-  vpr_hires = (
-      4 * np.pi**2 * Rmaj * r_hires * kappa_hires
-      + volume_hires / kappa_hires * (kappa_param - 1) / rmax
+  # On the hires grid, V' and S' are evaluated as polynomials in r_hires_norm
+  # (in Horner form), with coefficients obtained by expanding the same
+  # expressions as on the cell grid for r = rmax * r_hires_norm and
+  # kappa = 1 + r_hires_norm * (kappa_param - 1).
+  # V' = 4*pi^2*Rmaj*r*kappa + 2*pi^2*Rmaj*r^2*dkappa_dr
+  vpr_hires_coeff_1 = 4 * np.pi**2 * Rmaj * rmax
+  vpr_hires_coeff_2 = 6 * np.pi**2 * Rmaj * rmax * (kappa_param - 1)
+  vpr_hires = r_hires_norm * (
+      vpr_hires_coeff_1 + vpr_hires_coeff_2 * r_hires_norm
   )
-  # S' for area integrals on hires grid
-  spr_hires = (
-      2 * np.pi * r_hires * kappa_hires
-      + area_hires / kappa_hires * (kappa_param - 1) / rmax
+  # S' = 2*pi*r*kappa + pi*r^2*dkappa_dr
+  spr_hires_coeff_1 = 2 * np.pi * rmax
+  spr_hires_coeff_2 = 3 * np.pi * rmax * (kappa_param - 1)
+  spr_hires = r_hires_norm * (
+      spr_hires_coeff_1 + spr_hires_coeff_2 * r_hires_norm
   )
 
   g3_hires = 1 / (Rmaj**2 * (1 - (r_hires / Rmaj) ** 2) ** (3.0 / 2.0))
-  J_hires = np.ones(len(r_hires))
+  J_hires = np.ones(nr_hires)
   g2g3_over_rho_hires = 4 * np.pi**2 * vpr_hires * g3_hires / (J_hires * Rmaj)
 
-  return CircularAnalyticalGeometry(
+  geo = CircularAnalyticalGeometry(
       # Set the standard geometry params.
       geometry_type=GeometryType.CIRCULAR.value,
       dr_norm=np.asarray(dr_norm),
@@ -603,11 +646,8 @@ def build_circular_geometry(
       # Set the circular geometry-specific params.
       kappa=kappa,
       kappa_face=kappa_face,
-      volume_hires=volume_hires,
-      area_hires=area_hires,
       spr_hires=spr_hires,
       r_hires_norm=r_hires_norm,
-      r_hires=r_hires,
       kappa_hires=kappa_hires,
       vpr_hires=vpr_hires,
       # always initialize Phibdot as zero. It will be replaced once both geo_t
@@ -615,6 +655,7 @@ def build_circular_geometry(
       # geo_t_plus_dt for each given time interval.
       Phibdot=np.asarray(0.0),
   )
+  return set_arrays_read_only(geo)
 
 
 # pylint: disable=invalid-name
@@ -724,9 +765,16 @@ class StandardGeometryIntermediates:
     # grid. CHEASE variables are normalized. Need to unnormalize them with
     # reference values poloidal flux and CHEASE-internal-calculated plasma
     # current.
-    psiunnormfactor = (Rmaj**2 * B0) * 2 * np.pi
+    # Unnormalization factors shared by the variables below.
+    Rmaj2 = Rmaj**2
+    Rmaj3 = Rmaj2 * Rmaj
+    RmajB0 = Rmaj * B0
+    two_pi = 2 * np.pi
+    four_pi2 = two_pi**2
+
+    psiunnormfactor = Rmaj2 * B0 * two_pi
     psi = chease_data['PSIchease=psi/2pi'] * psiunnormfactor
-    Ip_chease = chease_data['Ipprofile'] / constants.CONSTANTS.mu0 * Rmaj * B0
+    Ip_chease = chease_data['Ipprofile'] * (RmajB0 / constants.CONSTANTS.mu0)
 
     # toroidal flux coordinate
     rho = chease_data['RHO_TOR=sqrt(Phi/pi/B0)'] * Rmaj
@@ -735,19 +783,17 @@ class StandardGeometryIntermediates:
     Rin_chease = chease_data['R_INBOARD'] * Rmaj
     Rout_chease = chease_data['R_OUTBOARD'] * Rmaj
     # toroidal field flux function
-    RBphi = chease_data['T=RBphi'] * Rmaj * B0
-
-    int_Jdchi = chease_data['Int(Rdlp/|grad(psi)|)=Int(Jdchi)'] * Rmaj / B0
-    flux_norm_1_over_R2 = chease_data['<1/R**2>'] / Rmaj**2
-    flux_norm_Bp2 = chease_data['<Bp**2>'] * B0**2 * 4 * np.pi**2
-    flux_norm_dpsi = chease_data['<|grad(psi)|>'] * Rmaj * B0 * 2 * np.pi
-    flux_norm_dpsi2 = (
-        chease_data['<|grad(psi)|**2>'] * (Rmaj * B0) ** 2 * 4 * np.pi**2
-    )
+    RBphi = chease_data['T=RBphi'] * RmajB0
+
+    int_Jdchi = chease_data['Int(Rdlp/|grad(psi)|)=Int(Jdchi)'] * (Rmaj / B0)
+    flux_norm_1_over_R2 = chease_data['<1/R**2>'] / Rmaj2
+    flux_norm_Bp2 = chease_data['<Bp**2>'] * (B0**2 * four_pi2)
+    flux_norm_dpsi = chease_data['<|grad(psi)|>'] * (RmajB0 * two_pi)
+    flux_norm_dpsi2 = chease_data['<|grad(psi)|**2>'] * (RmajB0**2 * four_pi2)
 
     # volume, area, and dV/drho, dS/drho
-    volume = chease_data['VOLUMEprofile'] * Rmaj**3
-    area = chease_data['areaprofile'] * Rmaj**2
+    volume = chease_data['VOLUMEprofile'] * Rmaj3
+    area = chease_data['areaprofile'] * Rmaj2
 
     return cls(
         Ip_from_parameters=Ip_from_parameters,
@@ -775,18 +821,41 @@ class StandardGeometryIntermediates:
     )
 
 
-def build_standard_geometry(
+def _interp_stacked_profiles(
+    x: np.ndarray, xp: np.ndarray, fp: np.ndarray
+) -> np.ndarray:
+  """Linearly interpolates a stack of profiles sharing the same abscissa.
+
+  Equivalent to calling `np.interp(x, xp, fp[k])` for every row `k` of `fp`,
+  but the interval search on `xp` is only done once.
+
+  Args:
+    x: Coordinates at which to evaluate the interpolated values.
+    xp: Monotonically increasing coordinates of the data points.
+    fp: Array of shape (num_profiles, len(xp)) with the profile values.
+
+  Returns:
+    Array of shape (num_profiles, len(x)) with the interpolated values. Values
+    outside of the range of `xp` are clamped to the boundary values.
+  """
+  idx = np.clip(np.searchsorted(xp, x, side='right') - 1, 0, len(xp) - 2)
+  weight = np.clip((x - xp[idx]) / (xp[idx + 1] - xp[idx]), 0.0, 1.0)
+  return (1.0 - weight) * fp[:, idx] + weight * fp[:, idx + 1]
+
+
+def _flux_surface_profiles(
     intermediate: StandardGeometryIntermediates,
-) -> StandardGeometry:
-  """Build geometry object based on set of profiles from an EQ solution.
+) -> tuple[np.ndarray, ...]:
+  """Computes the flux surface averaged profiles on the input rhon grid.
+
+  This is all plain vectorized NumPy on the (small) input profiles, run once
+  per geometry build on the host, before interpolating onto the TORAX grids.
 
   Args:
-    intermediate: A StandardGeometryIntermediates object that holds the
-      intermediate values used to build a StandardGeometry for this timeslice.
-      These can either be direct or interpolated values.
+    intermediate: The intermediate values used to build a StandardGeometry.
 
   Returns:
-    A StandardGeometry object.
+    Tuple of g0, g1, g2, g3, g2g3_over_rho and psi_from_Ip.
   """
   # flux surface integrals of various geometry quantities
   C1 = intermediate.int_Jdchi
@@ -814,18 +883,34 @@ def build_standard_geometry(
       / (g2g3_over_rho[1:] * intermediate.Rmaj * J[1:])
   )
   dpsidrho = np.concatenate((np.zeros(1), dpsidrho))
-  psi_from_Ip = scipy.integrate.cumulative_trapezoid(
-      y=dpsidrho, x=intermediate.rho, initial=0.0
-  )
 
-  # set Ip-consistent psi derivative boundary condition (although will be
-  # replaced later with an fvm constraint)
-  psi_from_Ip[-1] = psi_from_Ip[-2] + (
-      16 * constants.CONSTANTS.mu0 * np.pi**4
-  ) * intermediate.Ip_profile[-1] / (
-      g2g3_over_rho[-1] * intermediate.Rmaj * J[-1]
-  ) * (
-      intermediate.rho[-1] - intermediate.rho[-2]
+  # Cumulative trapezoid integration of dpsidrho, done as a single cumsum over
+  # the segment integrals. The last segment uses the Ip-consistent psi
+  # derivative boundary condition (although will be replaced later with an fvm
+  # constraint) instead of the trapezoid rule.
+  drho = np.diff(intermediate.rho)
+  psi_segments = 0.5 * (dpsidrho[1:] + dpsidrho[:-1]) * drho
+  psi_segments[-1] = dpsidrho[-1] * drho[-1]
+  psi_from_Ip = np.concatenate((np.zeros(1), np.cumsum(psi_segments)))
+
+  return g0, g1, g2, g3, g2g3_over_rho, psi_from_Ip
+
+
+def build_standard_geometry(
+    intermediate: StandardGeometryIntermediates,
+) -> StandardGeometry:
+  """Build geometry object based on set of profiles from an EQ solution.
+
+  Args:
+    intermediate: A StandardGeometryIntermediates object that holds the
+      intermediate values used to build a StandardGeometry for this timeslice.
+      These can either be direct or interpolated values.
+
+  Returns:
+    A StandardGeometry object.
+  """
+  g0, g1, g2, g3, g2g3_over_rho, psi_from_Ip = _flux_surface_profiles(
+      intermediate
   )
 
   # dV/drho, dS/drho
@@ -859,73 +944,120 @@ def build_standard_geometry(
   # High resolution versions for j (plasma current) and psi (poloidal flux)
   # manipulations. Needed if psi is initialized from plasma current.
   r_hires_norm = np.linspace(0, 1, intermediate.nr * intermediate.hires_fac)
-  r_hires = r_hires_norm * rmax
 
-  rhon_interpolation_func = lambda x, y: np.interp(x, intermediate.rhon, y)
-  # V' for volume integrations on face grid
-  vpr_face = rhon_interpolation_func(r_face_norm, vpr)
-  # V' for volume integrations on cell grid
-  vpr_hires = rhon_interpolation_func(r_hires_norm, vpr)
-  vpr = rhon_interpolation_func(r_norm, vpr)
+  # Interpolate all profiles onto the face, cell and hires grids. The profiles
+  # are stacked so that the bucket search on rhon is done once per target grid
+  # rather than once per profile.
+  profile_names = (
+      'vpr',
+      'spr',
+      'delta_upper_face',
+      'delta_lower_face',
+      'RBphi',
+      'psi',
+      'psi_from_Ip',
+      'jtot',
+      'Rin',
+      'Rout',
+      'g0',
+      'g1',
+      'g2',
+      'g3',
+      'g2g3_over_rho',
+      'volume',
+      'area',
+  )
+  profiles = np.stack([
+      vpr,
+      spr,
+      intermediate.delta_upper_face,
+      intermediate.delta_lower_face,
+      intermediate.RBphi,
+      intermediate.psi,
+      psi_from_Ip,
+      jtot,
+      intermediate.Rin,
+      intermediate.Rout,
+      g0,
+      g1,
+      g2,
+      g3,
+      g2g3_over_rho,
+      intermediate.volume,
+      intermediate.area,
+  ])
+  # The three target grids are also concatenated, so that a single interval
+  # search and a single gather serve all of them.
+  target_grids = (r_face_norm, r_norm, r_hires_norm)
+  split_profiles = np.split(
+      _interp_stacked_profiles(
+          np.concatenate(target_grids), intermediate.rhon, profiles
+      ),
+      np.cumsum([len(grid) for grid in target_grids[:-1]]),
+      axis=1,
+  )
+  face = dict(zip(profile_names, split_profiles[0]))
+  cell = dict(zip(profile_names, split_profiles[1]))
+  hires = dict(zip(profile_names, split_profiles[2]))
 
-  # S' for area integrals on face grid
-  spr_face = rhon_interpolation_func(r_face_norm, spr)
-  # S' for area integrals on cell grid
-  spr_cell = rhon_interpolation_func(r_norm, spr)
-  spr_hires = rhon_interpolation_func(r_hires_norm, spr)
+  # V' for volume integrations
+  vpr_face = face['vpr']
+  vpr_hires = hires['vpr']
+  vpr = cell['vpr']
+
+  # S' for area integrals
+  spr_face = face['spr']
+  spr_cell = cell['spr']
+  spr_hires = hires['spr']
 
-  # triangularity on cell grid
-  delta_upper_face = rhon_interpolation_func(
-      r_face_norm, intermediate.delta_upper_face)
-  delta_lower_face = rhon_interpolation_func(
-      r_face_norm, intermediate.delta_lower_face)
+  # triangularity on face grid
+  delta_upper_face = face['delta_upper_face']
+  delta_lower_face = face['delta_lower_face']
 
   # average triangularity
   delta_face = 0.5 * (delta_upper_face + delta_lower_face)
 
-  F_face = rhon_interpolation_func(r_face_norm, intermediate.RBphi)
-  F = rhon_interpolation_func(r_norm, intermediate.RBphi)
-  F_hires = rhon_interpolation_func(r_hires_norm, intermediate.RBphi)
+  F_face = face['RBphi']
+  F = cell['RBphi']
+  F_hires = hires['RBphi']
   # Normalized toroidal flux function
   J = F / intermediate.Rmaj / intermediate.B
   J_face = F_face / intermediate.Rmaj / intermediate.B
   J_hires = F_hires / intermediate.Rmaj / intermediate.B
 
-  psi = rhon_interpolation_func(r_norm, intermediate.psi)
-  psi_from_Ip = rhon_interpolation_func(r_norm, psi_from_Ip)
+  psi = cell['psi']
+  psi_from_Ip = cell['psi_from_Ip']
 
-  jtot_face = rhon_interpolation_func(r_face_norm, jtot)
-  jtot = rhon_interpolation_func(r_norm, jtot)
+  jtot_face = face['jtot']
+  jtot = cell['jtot']
 
-  Rin_face = rhon_interpolation_func(r_face_norm, intermediate.Rin)
-  Rin = rhon_interpolation_func(r_norm, intermediate.Rin)
+  Rin_face = face['Rin']
+  Rin = cell['Rin']
 
-  Rout_face = rhon_interpolation_func(r_face_norm, intermediate.Rout)
-  Rout = rhon_interpolation_func(r_norm, intermediate.Rout)
+  Rout_face = face['Rout']
+  Rout = cell['Rout']
 
-  g0_face = rhon_interpolation_func(r_face_norm, g0)
-  g0 = rhon_interpolation_func(r_norm, g0)
+  g0_face = face['g0']
+  g0 = cell['g0']
 
-  g1_face = rhon_interpolation_func(r_face_norm, g1)
-  g1 = rhon_interpolation_func(r_norm, g1)
+  g1_face = face['g1']
+  g1 = cell['g1']
 
-  g2_face = rhon_interpolation_func(r_face_norm, g2)
-  g2 = rhon_interpolation_func(r_norm, g2)
+  g2_face = face['g2']
+  g2 = cell['g2']
 
-  g3_face = rhon_interpolation_func(r_face_norm, g3)
-  g3 = rhon_interpolation_func(r_norm, g3)
+  g3_face = face['g3']
+  g3 = cell['g3']
 
-  g2g3_over_rho_face = rhon_interpolation_func(r_face_norm, g2g3_over_rho)
-  g2g3_over_rho_hires = rhon_interpolation_func(r_hires_norm, g2g3_over_rho)
-  g2g3_over_rho = rhon_interpolation_func(r_norm, g2g3_over_rho)
+  g2g3_over_rho_face = face['g2g3_over_rho']
+  g2g3_over_rho_hires = hires['g2g3_over_rho']
+  g2g3_over_rho = cell['g2g3_over_rho']
 
-  volume_face = rhon_interpolation_func(r_face_norm, intermediate.volume)
-  volume_hires = rhon_interpolation_func(r_hires_norm, intermediate.volume)
-  volume = rhon_interpolation_func(r_norm, intermediate.volume)
+  volume_face = face['volume']
+  volume = cell['volume']
 
-  area_face = rhon_interpolation_func(r_face_norm, intermediate.area)
-  area_hires = rhon_interpolation_func(r_hires_norm, intermediate.area)
-  area = rhon_interpolation_func(r_norm, intermediate.area)
+  area_face = face['area']
+  area = cell['area']
 
   return StandardGeometry(
       geometry_type=GeometryType.CHEASE.value,
@@ -972,11 +1104,8 @@ def build_standard_geometry(
       jtot_face=jtot_face,
       delta_upper_face=delta_upper_face,
       delta_lower_face=delta_lower_face,
-      volume_hires=volume_hires,
-      area_hires=area_hires,
       spr_hires=spr_hires,
       r_hires_norm=r_hires_norm,
-      r_hires=r_hires,
       vpr_hires=vpr_hires,
       # always initialize Phibdot as zero. It will be replaced once both geo_t
       # and geo_t_plus_dt are provided, and set to be the same for geo_t and
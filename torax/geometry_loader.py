@@ -44,11 +44,17 @@ def initialize_CHEASE_dict(  # pylint: disable=invalid-name
   }
 
 
-def load_chease_data(
-    geometry_dir: str | None,
-    geometry_file: str,
-) -> dict[str, np.ndarray]:
-  """Loads the data from a CHEASE file into a dictionary."""
+def get_geometry_dir(geometry_dir: str | None) -> str:
+  """Returns the directory to load geometry files from.
+
+  Args:
+    geometry_dir: Directory where to find the geometry files. If None, uses the
+      environment variable TORAX_GEOMETRY_DIR if available, otherwise a default
+      directory.
+
+  Returns:
+    The resolved geometry directory.
+  """
   # The code below does not use os.environ.get() in order to support an internal
   # version of the code.
   if geometry_dir is None:
@@ -56,6 +62,15 @@ def load_chease_data(
       geometry_dir = os.environ['TORAX_GEOMETRY_DIR']
     else:
       geometry_dir = 'torax/data/third_party/geo'
+  return geometry_dir
+
+
+def load_chease_data(
+    geometry_dir: str | None,
+    geometry_file: str,
+) -> dict[str, np.ndarray]:
+  """Loads the data from a CHEASE file into a dictionary."""
+  geometry_dir = get_geometry_dir(geometry_dir)
 
   # initialize geometry from file
   return initialize_CHEASE_dict(
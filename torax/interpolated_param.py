@@ -141,7 +141,9 @@ class StepInterpolatedParam(InterpolatedParamBase):
       self,
       x: chex.Numeric,
   ) -> chex.Array:
-    idx = jnp.max(jnp.argwhere(self._padded_xs < x).flatten())
+    # Index of the last padded x strictly less than x, found by binary search.
+    # The leading -inf pad guarantees idx >= 0.
+    idx = jnp.searchsorted(self._padded_xs, x, side='left') - 1
     return self._padded_ys[idx]
 
 
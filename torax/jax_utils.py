@@ -55,6 +55,11 @@ def env_bool(name: str, default: bool) -> bool:
 # persistent compilation cache.
 _ERRORS_ENABLED: bool = env_bool('TORAX_ERRORS_ENABLED', False)
 
+# If True, sources check the rank and shape of the profiles they output. These
+# checks only run in Python (at trace time under jit), so they can be turned off
+# to save overhead on eagerly evaluated runs.
+_SHAPE_CHECKS_ENABLED: bool = env_bool('TORAX_SHAPE_CHECKS_ENABLED', True)
+
 # If True, jax_utils.jit is jax.jit and causes compilation.
 # Otherwise, jax_utils.jit is a no-op for debugging purposes.
 # This setting cannot be changed because it determines the behavior
@@ -85,6 +90,16 @@ def enable_errors(value: bool):
     _ERRORS_ENABLED = previous_value
 
 
+def errors_enabled() -> bool:
+  """Returns whether `error_if` functions currently raise errors."""
+  return _ERRORS_ENABLED
+
+
+def shape_checks_enabled() -> bool:
+  """Returns whether sources check the shapes of their output profiles."""
+  return _SHAPE_CHECKS_ENABLED
+
+
 def error_if(
     var: jax.Array | float,
     cond: jax.Array | bool,
@@ -103,9 +118,9 @@ def error_if(
     var: Identity wrapper that must be used for the check to be included.
   """
   var = jnp.array(var)
-  cond = jnp.array(cond)
   if not _ERRORS_ENABLED:
     return var
+  cond = jnp.array(cond)
   return eqx.error_if(var, cond, msg)
 
 
@@ -126,10 +141,13 @@ def error_if_not_positive(
     var: Identity wrapper that must be used for the check to be included.
   """
   var = jnp.array(var)
-  msg = f'{name} must be > 0.'
-  min_var = jnp.min(var)
   if to_wrap is None:
     to_wrap = var
+  if not _ERRORS_ENABLED:
+    # Skip building the reduction and comparison that error_if would ignore.
+    return jnp.array(to_wrap)
+  msg = f'{name} must be > 0.'
+  min_var = jnp.min(var)
   return error_if(to_wrap, min_var <= 0, msg)
 
 
@@ -150,10 +168,13 @@ def error_if_negative(
     var: Identity wrapper that must be used for the check to be included.
   """
   var = jnp.array(var)
-  msg = f'{name} must be >= 0.'
-  min_var = jnp.min(var)
   if to_wrap is None:
     to_wrap = var
+  if not _ERRORS_ENABLED:
+    # Skip building the reduction and comparison that error_if would ignore.
+    return jnp.array(to_wrap)
+  msg = f'{name} must be >= 0.'
+  min_var = jnp.min(var)
   return error_if(to_wrap, min_var < 0, msg)
 
 
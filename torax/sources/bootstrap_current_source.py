@@ -177,11 +177,9 @@ class BootstrapCurrentSource(source.Source):
       affected_core_profile: int,
       geo: geometry.Geometry,
   ) -> jax.Array:
-    return jnp.where(
-        affected_core_profile in self.affected_core_profiles_ints,
-        profile['j_bootstrap'],
-        jnp.zeros_like(geo.r),
-    )
+    if affected_core_profile not in self.affected_core_profiles_ints:
+      return jnp.zeros_like(geo.r)
+    return profile['j_bootstrap']
 
 
 @jax_utils.jit
@@ -216,11 +216,7 @@ class ExternalCurrentSource(source.Source):
         geo=geo,
         core_profiles=core_profiles,
         # There is no model implementation.
-        model_func=(
-            lambda _0, _1, _2, _3, _4: source.ProfileType.FACE.get_zero_profile(
-                geo
-            )
-        ),
+        model_func=None,
         formula=self.formula,
         output_shape=source.ProfileType.FACE.get_profile_shape(geo),
         source_models=getattr(self, 'source_models', None),
@@ -242,9 +238,7 @@ class ExternalCurrentSource(source.Source):
         geo=geo,
         core_profiles=None,
         # There is no model for this source.
-        model_func=(
-            lambda _0, _1, _2, _3, _4: jnp.zeros_like(geo.r_hires_norm)
-        ),
+        model_func=None,
         formula=self.hires_formula,
         output_shape=geo.r_hires_norm.shape,
         source_models=getattr(self, 'source_models', None),
@@ -256,11 +250,9 @@ class ExternalCurrentSource(source.Source):
       affected_core_profile: int,
       geo: geometry.Geometry,
   ) -> jax.Array:
-    return jnp.where(
-        affected_core_profile in self.affected_core_profiles_ints,
-        profile[0],  # the jext profile
-        jnp.zeros_like(geo.r),
-    )
+    if affected_core_profile not in self.affected_core_profiles_ints:
+      return jnp.zeros_like(geo.r)
+    return profile[0]  # the jext profile
 
 
 ExternalCurrentSourceBuilder = source.make_source_builder(
@@ -115,8 +115,9 @@ def calc_fusion(
       / D1
   )
   frac_e = 1.0 - frac_i
-  Pfus_i = Pfus_cell * frac_i * alpha_fraction
-  Pfus_e = Pfus_cell * frac_e * alpha_fraction
+  Palpha_cell = Pfus_cell * alpha_fraction
+  Pfus_i = Palpha_cell * frac_i
+  Pfus_e = Palpha_cell * frac_e
 
   return Ptot, Pfus_i, Pfus_e
 
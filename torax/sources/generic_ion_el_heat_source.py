@@ -96,8 +96,10 @@ def calc_generic_heat_source(
   # calculate constant prefactor
   C = Ptot / jax.scipy.integrate.trapezoid(geo.vpr_face * Q_face, geo.r_face)
 
-  source_ion = C * Q * (1 - el_heat_fraction)
-  source_el = C * Q * el_heat_fraction
+  # The ion and electron profiles are both scaled versions of the same profile.
+  source_total = C * Q
+  source_ion = source_total * (1 - el_heat_fraction)
+  source_el = source_total * el_heat_fraction
 
   return source_ion, source_el
 
@@ -25,6 +25,7 @@ from __future__ import annotations
 
 import dataclasses
 import enum
+import functools
 import types
 import typing
 from typing import Any, Callable, Optional, Protocol
@@ -74,7 +75,7 @@ def get_cell_profile_shape(
     geo: geometry.Geometry,
 ):
   """Returns the shape of a source profile on the cell grid."""
-  return ProfileType.CELL.get_profile_shape(geo)
+  return geo.r.shape
 
 
 @enum.unique
@@ -106,6 +107,11 @@ class Source:
 
   NOTE: For most use cases, you should extend or use SingleProfileSource.
 
+  Sources hold no array data: everything that can change between time steps
+  lives in the DynamicRuntimeParams passed to get_value(). Sources are
+  therefore passed to jitted functions as static arguments (usually through
+  SourceModels), and only recompile when the source configuration changes.
+
   Attributes:
     runtime_params: Input dataclass containing all the source-specific runtime
       parameters. At runtime, the parameters here are interpolated to a specific
@@ -129,6 +135,8 @@ class Source:
       "FORMULA_BASED". If not provided, then it defaults to returning zeros.
     affected_core_profiles_ints: Derived property from the
       affected_core_profiles. Integer values of those enums.
+    supported_modes_ints: Derived property from the supported_modes. Integer
+      values of those enums.
   """
 
   affected_core_profiles: tuple[AffectedCoreProfile, ...]
@@ -144,18 +152,33 @@ class Source:
 
   formula: SourceProfileFunction | None = None
 
-  @property
+  # Sources are frozen and hashable so they can be static arguments to jitted
+  # functions. They deliberately don't use slots=True: the derived properties
+  # below are cached in the instance __dict__.
+  @functools.cached_property
   def affected_core_profiles_ints(self) -> tuple[int, ...]:
     return tuple([int(cp) for cp in self.affected_core_profiles])
 
+  @functools.cached_property
+  def supported_modes_ints(self) -> tuple[int, ...]:
+    return tuple([mode.value for mode in self.supported_modes])
+
   def check_mode(
       self,
       mode: int | jax.Array,
   ) -> jax.Array:
     """Raises an error if the source type is not supported."""
     # This function is really just a wrapper around jax_utils.error_if with the
-    # custom error message coming from this class.
-    mode = jnp.array(mode)
+    # custom error message coming from this class. error_if is a pass through
+    # when errors are disabled, so skip building the check entirely.
+    if not jax_utils.errors_enabled():
+      return mode  # pytype: disable=bad-return-type
+    # A mode known at trace time is checked in Python, keeping the check out of
+    # the traced graph.
+    if not jax_utils.is_tracer(jnp.asarray(mode)):
+      if int(mode) not in self.supported_modes_ints:
+        raise ValueError(self._unsupported_mode_error_msg(mode))
+      return mode  # pytype: disable=bad-return-type
     mode = jax_utils.error_if(
         mode,
         jnp.logical_not(self._is_type_supported(mode)),
@@ -168,13 +191,7 @@ class Source:
       mode: int | jax.Array,
   ) -> jax.Array:
     """Returns whether the source type is supported."""
-    mode = jnp.array(mode)
-    return jnp.any(
-        jnp.bool_([
-            supported_mode.value == mode
-            for supported_mode in self.supported_modes
-        ])
-    )
+    return jnp.isin(mode, jnp.asarray(self.supported_modes_ints))
 
   def _unsupported_mode_error_msg(
       self,
@@ -212,23 +229,13 @@ class Source:
     """
     self.check_mode(dynamic_source_runtime_params.mode)
     output_shape = self.output_shape_getter(geo)
-    model_func = (
-        (lambda _0, _1, _2, _3, _4: jnp.zeros(output_shape))
-        if self.model_func is None
-        else self.model_func
-    )
-    formula = (
-        (lambda _0, _1, _2, _3, _4: jnp.zeros(output_shape))
-        if self.formula is None
-        else self.formula
-    )
     return get_source_profiles(
         dynamic_runtime_params_slice=dynamic_runtime_params_slice,
         dynamic_source_runtime_params=dynamic_source_runtime_params,
         geo=geo,
         core_profiles=core_profiles,
-        model_func=model_func,
-        formula=formula,
+        model_func=self.model_func,
+        formula=self.formula,
         output_shape=output_shape,
         source_models=getattr(self, 'source_models', None),
     )
@@ -270,16 +277,12 @@ class Source:
 
     Returns: The source profile on the cell grid for the requested core profile.
     """
-    # Get a valid index that defaults to 0 if not present.
+    # affected_core_profile is a Python int, so the lookup is resolved at trace
+    # time instead of with array ops.
     affected_core_profile_ints = self.affected_core_profiles_ints
-    idx = jnp.argmax(
-        jnp.asarray(affected_core_profile_ints) == affected_core_profile
-    )
-    return jnp.where(
-        affected_core_profile in affected_core_profile_ints,
-        profile[idx, ...],
-        jnp.zeros_like(geo.r),
-    )
+    if affected_core_profile not in affected_core_profile_ints:
+      return jnp.zeros_like(geo.r)
+    return profile[affected_core_profile_ints.index(affected_core_profile)]
 
 
 @dataclasses.dataclass(kw_only=True, frozen=True, eq=True)
@@ -404,8 +407,9 @@ class SingleProfileSource(Source):
         core_profiles=core_profiles,
     )
     assert isinstance(profile, jax.Array)
-    chex.assert_rank(profile, 1)
-    chex.assert_shape(profile, output_shape)
+    if jax_utils.shape_checks_enabled():
+      chex.assert_rank(profile, 1)
+      chex.assert_shape(profile, output_shape)
     return profile
 
   def get_source_profile_for_affected_core_profile(
@@ -414,11 +418,9 @@ class SingleProfileSource(Source):
       affected_core_profile: int,
       geo: geometry.Geometry,
   ) -> jax.Array:
-    return jnp.where(
-        affected_core_profile in self.affected_core_profiles_ints,
-        profile,
-        jnp.zeros_like(geo.r),
-    )
+    if affected_core_profile not in self.affected_core_profiles_ints:
+      return jnp.zeros_like(geo.r)
+    return profile
 
 
 class ProfileType(enum.Enum):
@@ -432,11 +434,9 @@ class ProfileType(enum.Enum):
 
   def get_profile_shape(self, geo: geometry.Geometry) -> tuple[int, ...]:
     """Returns the expected length of the source profile."""
-    profile_type_to_len = {
-        ProfileType.CELL: geo.r.shape,
-        ProfileType.FACE: geo.r_face.shape,
-    }
-    return profile_type_to_len[self]
+    if self is ProfileType.CELL:
+      return geo.r.shape
+    return geo.r_face.shape
 
   def get_zero_profile(self, geo: geometry.Geometry) -> jax.Array:
     """Returns a source profile with all zeros."""
@@ -449,8 +449,8 @@ def get_source_profiles(  # pytype: disable=name-error
     dynamic_source_runtime_params: runtime_params_lib.DynamicRuntimeParams,
     geo: geometry.Geometry,
     core_profiles: state.CoreProfiles | None,
-    model_func: SourceProfileFunction,
-    formula: SourceProfileFunction,
+    model_func: SourceProfileFunction | None,
+    formula: SourceProfileFunction | None,
     output_shape: tuple[int, ...],
     source_models: Optional['source_models.SourceModels'],
 ) -> jax.Array:
@@ -467,40 +467,56 @@ def get_source_profiles(  # pytype: disable=name-error
     geo: Geometry information. Used as input to the source profile functions.
     core_profiles: Core plasma profiles. Used as input to the source profile
       functions.
-    model_func: Model function.
-    formula: Formula implementation.
+    model_func: Model function. If None, the model outputs zeros.
+    formula: Formula implementation. If None, the formula outputs zeros.
     output_shape: Expected shape of the outut array.
     source_models: The SourceModels if the Source `links_back`
 
   Returns:
     Output array of a profile or concatenated/stacked profiles.
   """
-  mode = dynamic_source_runtime_params.mode
-  zeros = jnp.zeros(output_shape)
-  output = jnp.zeros(output_shape)
-  output += jnp.where(
-      mode == runtime_params_lib.Mode.MODEL_BASED.value,
-      model_func(
-          dynamic_runtime_params_slice,
-          dynamic_source_runtime_params,
-          geo,
-          core_profiles,
-          source_models,
-      ),
-      zeros,
+  args = (
+      dynamic_runtime_params_slice,
+      dynamic_source_runtime_params,
+      geo,
+      core_profiles,
+      source_models,
   )
-  output += jnp.where(
-      mode == runtime_params_lib.Mode.FORMULA_BASED.value,
-      formula(
-          dynamic_runtime_params_slice,
-          dynamic_source_runtime_params,
-          geo,
-          core_profiles,
-          source_models,
-      ),
-      zeros,
+
+  def zero_branch() -> jax.Array:
+    return jnp.zeros(output_shape)
+
+  # Branches are indexed by the integer value of the Mode enum. Through
+  # lax.switch only the branch selected at runtime is evaluated, instead of
+  # computing both the model and the formula and masking one of them out.
+  branches = [zero_branch] * len(runtime_params_lib.Mode)
+  if model_func is not None:
+    branches[runtime_params_lib.Mode.MODEL_BASED.value] = functools.partial(
+        model_func, *args
+    )
+  if formula is not None:
+    branches[runtime_params_lib.Mode.FORMULA_BASED.value] = functools.partial(
+        formula, *args
+    )
+  mode = dynamic_source_runtime_params.mode
+  # All branches are broadcast to output_shape, as lax.switch needs them to
+  # agree on their output shape. The concrete path does the same so that both
+  # paths return the same shape.
+  if not jax_utils.is_tracer(jnp.asarray(mode)):
+    # The mode is known at trace time, so the selected branch is called
+    # directly. Python indexing would wrap negative modes around, so the mode
+    # is range-checked even when errors are disabled.
+    mode_int = int(mode)
+    if not 0 <= mode_int < len(branches):
+      raise ValueError(f'Invalid source mode: {mode_int}.')
+    return jnp.broadcast_to(branches[mode_int](), output_shape)
+  return jax.lax.switch(
+      mode,
+      [
+          lambda branch=branch: jnp.broadcast_to(branch(), output_shape)
+          for branch in branches
+      ],
   )
-  return output
 
 
 # Convenience classes to reduce a little boilerplate for some of the common
@@ -606,8 +622,9 @@ class IonElectronSource(Source):
         core_profiles=core_profiles,
     )
     assert isinstance(profile, jax.Array)
-    chex.assert_rank(profile, 2)
-    chex.assert_shape(profile, output_shape)
+    if jax_utils.shape_checks_enabled():
+      chex.assert_rank(profile, 2)
+      chex.assert_shape(profile, output_shape)
     return profile
 
 
@@ -664,22 +681,6 @@ def is_source_builder(obj, raise_if_false: bool = False) -> bool:
   return True
 
 
-def _convert_source_builder_to_init_kwargs(
-    source_builder: ...,
-) -> dict[str, Any]:
-  """Returns a dict of init kwargs for the source builder."""
-  source_init_kwargs = {}
-  for field in dataclasses.fields(source_builder):
-    if field.name == 'runtime_params':
-      continue
-    # for loop with getattr copies each field exactly as it exists.
-    # dataclasses.asdict will recursivesly convert fields to dicts,
-    # including turning custom dataclasses with __call__ methods into
-    # plain Python dictionaries.
-    source_init_kwargs[field.name] = getattr(source_builder, field.name)
-  return source_init_kwargs
-
-
 def make_source_builder(
     source_type: ...,
     runtime_params_type: ... = runtime_params_lib.RuntimeParams,
@@ -700,6 +701,21 @@ def make_source_builder(
   Returns:
     builder: a Builder dataclass for the given Source dataclass.
   """
+  # The cache is keyed on exactly how its arguments are passed, so pass them
+  # all positionally. This way each combination of arguments maps to a single
+  # builder class, whether or not the defaults were spelled out, and repeated
+  # requests (e.g. re-running a config module) don't create distinct classes
+  # that fail isinstance checks against each other.
+  return _make_source_builder(source_type, runtime_params_type, links_back)
+
+
+@functools.lru_cache(maxsize=None)
+def _make_source_builder(
+    source_type,
+    runtime_params_type,
+    links_back,
+) -> SourceBuilderProtocol:
+  """Cached implementation of make_source_builder."""
 
   source_fields = dataclasses.fields(source_type)
 
@@ -734,80 +750,107 @@ def make_source_builder(
   builder_ntfs = name_type_field_tuples + new_field_ntfs
   builder_type_name = source_type.__name__ + 'Builder'
 
-  def check_kwargs(source_init_kwargs, context_msg):
-    for f in source_fields:
-      v = source_init_kwargs[f.name]
-      if isinstance(f.type, str):
-        if f.type == 'tuple[AffectedCoreProfile, ...]':
-          assert isinstance(v, tuple)
-          assert all([isinstance(var, AffectedCoreProfile) for var in v])
-        elif f.type == 'tuple[runtime_params_lib.Mode, ...]':
-          assert isinstance(v, tuple)
-          assert all([isinstance(var, runtime_params_lib.Mode) for var in v])
-        elif f.type == 'SourceProfileFunction | None':
-          assert v is None or callable(v)
-        elif f.type == 'source.SourceProfileFunction':
-          if not callable(v):
-            raise TypeError(
-                f'While {context_msg} {source_type} got field '
-                f'{f.name} of type source.SoureProfileFunction '
-                ' but was passed constructor argument with value '
-                f'{v} of type {type(v)}. It is not callable, so '
-                'it cannot be a SourceProfileFunction.'
-            )
-        elif f.type in [
-            'source.SourceOutputShapeFunction',
-            'SourceOutputShapeFunction',
-        ]:
-          if not callable(v):
-            raise TypeError(
-                f'While {context_msg} {source_type} got field '
-                f'{f.name} of type source.SoureProfileFunction '
-                ' but was passed constructor argument with value '
-                f'{v} of type {type(v)}. It is not callable, so '
-                'it cannot be a SourceProfileFunction.'
-            )
-        else:
-          raise TypeError(f'Unrecognized type string: {f.type}')
-
-      # Check if the field is a parameterized generic.
-      # Python cannot check isinstance for parameterized generics, so we need
-      # to handle those cases differently.
-      # For instance, if a field type is `tuple[float, ...]` and the value is
-      # valid, like `(1, 2, 3)`, then `isinstance(v, f.type)` would raise a
-      # TypeError.
-      elif (
-          type(f.type) == types.GenericAlias  # pylint: disable=unidiomatic-typecheck
-          or typing.get_origin(f.type) is not None
-      ):
-        # Do a superficial check in these instances. Only check that the origin
-        # type matches the value. Don't look into the rest of the object.
-        if not isinstance(v, typing.get_origin(f.type)):
-          raise TypeError(
-              f'While {context_msg} {source_type} got field {f.name} with '
-              f'input type {type(v)} but an expected type {f.type}.'
-          )
+  init_field_names = tuple(f.name for f in source_fields)
 
-      else:
-        try:
-          type_works = isinstance(v, f.type)
-        except TypeError as exc:
-          raise TypeError(
-              f'While {context_msg} {source_type} got field '
-              f'{f.name} whose type is {f.type} of type'
-              f'{type(f.type)}. This is not a valid type.'
-          ) from exc
-        if not type_works:
-          raise TypeError(
-              f'While {context_msg} {source_type} got argument '
-              f'{f.name} of type {type(v)} but expected '
-              f'{f.type}).'
-          )
+  def convert_to_init_kwargs(source_builder) -> dict[str, Any]:
+    """Returns a dict of init kwargs for the source builder."""
+    # getattr copies each field exactly as it exists. dataclasses.asdict would
+    # recursively convert fields to dicts, including turning custom
+    # dataclasses with __call__ methods into plain Python dictionaries.
+    return {name: getattr(source_builder, name) for name in init_field_names}
+
+  def check_callable(f, v, context_msg):
+    if not callable(v):
+      raise TypeError(
+          f'While {context_msg} {source_type} got field '
+          f'{f.name} of type source.SoureProfileFunction '
+          ' but was passed constructor argument with value '
+          f'{v} of type {type(v)}. It is not callable, so '
+          'it cannot be a SourceProfileFunction.'
+      )
+
+  def check_affected_core_profiles(f, v, context_msg):
+    del f, context_msg  # Unused.
+    assert isinstance(v, tuple)
+    assert all([isinstance(var, AffectedCoreProfile) for var in v])
+
+  def check_modes(f, v, context_msg):
+    del f, context_msg  # Unused.
+    assert isinstance(v, tuple)
+    assert all([isinstance(var, runtime_params_lib.Mode) for var in v])
+
+  def check_optional_callable(f, v, context_msg):
+    del f, context_msg  # Unused.
+    assert v is None or callable(v)
+
+  # Checkers for fields whose annotations are strings, keyed by the annotation.
+  str_type_checkers = {
+      'tuple[AffectedCoreProfile, ...]': check_affected_core_profiles,
+      'tuple[runtime_params_lib.Mode, ...]': check_modes,
+      'SourceProfileFunction | None': check_optional_callable,
+      'source.SourceProfileFunction': check_callable,
+      'source.SourceOutputShapeFunction': check_callable,
+      'SourceOutputShapeFunction': check_callable,
+  }
+
+  # Check if the field is a parameterized generic.
+  # Python cannot check isinstance for parameterized generics, so we need
+  # to handle those cases differently.
+  # For instance, if a field type is `tuple[float, ...]` and the value is
+  # valid, like `(1, 2, 3)`, then `isinstance(v, f.type)` would raise a
+  # TypeError.
+  def check_generic(f, v, context_msg):
+    # Do a superficial check in these instances. Only check that the origin
+    # type matches the value. Don't look into the rest of the object.
+    if not isinstance(v, typing.get_origin(f.type)):
+      raise TypeError(
+          f'While {context_msg} {source_type} got field {f.name} with '
+          f'input type {type(v)} but an expected type {f.type}.'
+      )
+
+  def check_isinstance(f, v, context_msg):
+    if not isinstance(v, f.type):
+      raise TypeError(
+          f'While {context_msg} {source_type} got argument '
+          f'{f.name} of type {type(v)} but expected '
+          f'{f.type}).'
+      )
+
+  def get_field_checker(f):
+    if isinstance(f.type, str):
+      if f.type not in str_type_checkers:
+        raise TypeError(f'Unrecognized type string: {f.type}')
+      return str_type_checkers[f.type]
+    elif (
+        type(f.type) == types.GenericAlias  # pylint: disable=unidiomatic-typecheck
+        or typing.get_origin(f.type) is not None
+    ):
+      return check_generic
+    else:
+      # Make sure isinstance works with this type once, up front, so that
+      # check_isinstance doesn't need to guard every call.
+      try:
+        isinstance(None, f.type)
+      except TypeError as exc:
+        raise TypeError(
+            f'While making builder for {source_type} got field '
+            f'{f.name} whose type is {f.type} of type'
+            f'{type(f.type)}. This is not a valid type.'
+        ) from exc
+      return check_isinstance
+
+  # The type dispatch only depends on the field types, so resolve it once per
+  # builder class rather than on every build.
+  field_checkers = tuple((f, get_field_checker(f)) for f in source_fields)
+
+  def check_kwargs(source_init_kwargs, context_msg):
+    for f, checker in field_checkers:
+      checker(f, source_init_kwargs[f.name], context_msg)
 
   # pylint doesn't like this function name because it doesn't realize
   # this function is to be installed in a class
   def __post_init__(self):  # pylint:disable=invalid-name
-    source_init_kwargs = _convert_source_builder_to_init_kwargs(self)
+    source_init_kwargs = convert_to_init_kwargs(self)
     check_kwargs(source_init_kwargs, 'making builder')
     # check_kwargs checks only the kwargs to Source, not SourceBuilder,
     # so it doesn't check "runtime_params"
@@ -833,7 +876,7 @@ def make_source_builder(
   if links_back:
 
     def build_source(self, source_models):
-      source_init_kwargs = _convert_source_builder_to_init_kwargs(self)
+      source_init_kwargs = convert_to_init_kwargs(self)
       source_init_kwargs['source_models'] = source_models
       check_kwargs(source_init_kwargs, 'building')
       source = source_type(**source_init_kwargs)
@@ -843,7 +886,7 @@ def make_source_builder(
   else:
 
     def build_source(self):
-      source_init_kwargs = _convert_source_builder_to_init_kwargs(self)
+      source_init_kwargs = convert_to_init_kwargs(self)
       check_kwargs(source_init_kwargs, 'building')
       source = source_type(**source_init_kwargs)
       check_source(source)
@@ -116,6 +116,55 @@ def build_source_profiles(
   )
 
 
+def _get_value_if(
+    pred: jax.Array | bool,
+    source: source_lib.Source,
+    *,
+    dynamic_runtime_params_slice: runtime_params_slice.DynamicRuntimeParamsSlice,
+    dynamic_source_runtime_params: runtime_params_lib.DynamicRuntimeParams,
+    geo: geometry.Geometry,
+    core_profiles: state.CoreProfiles,
+    zeros: jax.Array | source_profiles.BootstrapCurrentProfile | None = None,
+) -> jax.Array | source_profiles.BootstrapCurrentProfile:
+  """Returns the source value if pred is True, otherwise zeros.
+
+  Unlike selecting between the value and zeros, the source is only evaluated
+  when it is needed. Each explicit or implicit pass through
+  build_source_profiles would otherwise compute every source and throw away
+  the ones belonging to the other pass.
+
+  Args:
+    pred: Whether to evaluate the source.
+    source: The source to evaluate.
+    dynamic_runtime_params_slice: Input config for this time step.
+    dynamic_source_runtime_params: Input runtime parameters for this time step,
+      specific to this source.
+    geo: Geometry of the torus.
+    core_profiles: Core plasma profiles.
+    zeros: Value returned when pred is False. It must match the structure,
+      shapes and dtypes of the source value. If None, zeros of the source's
+      output shape are used.
+
+  Returns:
+    The source value if pred is True, otherwise zeros.
+  """
+  if zeros is None:
+    zeros = jnp.zeros(source.output_shape_getter(geo))
+
+  def get_value():
+    return source.get_value(
+        dynamic_runtime_params_slice,
+        dynamic_source_runtime_params,
+        geo,
+        core_profiles,
+    )
+
+  def get_zeros():
+    return zeros
+
+  return jax.lax.cond(pred, get_value, get_zeros)
+
+
 def _build_bootstrap_profiles(
     dynamic_runtime_params_slice: runtime_params_slice.DynamicRuntimeParamsSlice,
     dynamic_source_runtime_params: runtime_params_lib.DynamicRuntimeParams,
@@ -147,58 +196,17 @@ def _build_bootstrap_profiles(
   Returns:
     Bootstrap current profile.
   """
-  bootstrap_profile = j_bootstrap_source.get_value(
-      dynamic_runtime_params_slice=dynamic_runtime_params_slice,
-      dynamic_source_runtime_params=dynamic_source_runtime_params,
-      geo=geo,
-      core_profiles=core_profiles,
-  )
-  sigma = jax_utils.select(
+  return _get_value_if(
       jnp.logical_or(
           explicit == dynamic_source_runtime_params.is_explicit,
           calculate_anyway,
       ),
-      bootstrap_profile.sigma,
-      jnp.zeros_like(bootstrap_profile.sigma),
-  )
-  sigma_face = jax_utils.select(
-      jnp.logical_or(
-          explicit == dynamic_source_runtime_params.is_explicit,
-          calculate_anyway,
-      ),
-      bootstrap_profile.sigma_face,
-      jnp.zeros_like(bootstrap_profile.sigma_face),
-  )
-  j_bootstrap = jax_utils.select(
-      jnp.logical_or(
-          explicit == dynamic_source_runtime_params.is_explicit,
-          calculate_anyway,
-      ),
-      bootstrap_profile.j_bootstrap,
-      jnp.zeros_like(bootstrap_profile.j_bootstrap),
-  )
-  j_bootstrap_face = jax_utils.select(
-      jnp.logical_or(
-          explicit == dynamic_source_runtime_params.is_explicit,
-          calculate_anyway,
-      ),
-      bootstrap_profile.j_bootstrap_face,
-      jnp.zeros_like(bootstrap_profile.j_bootstrap_face),
-  )
-  I_bootstrap = jax_utils.select(  # pylint: disable=invalid-name
-      jnp.logical_or(
-          explicit == dynamic_source_runtime_params.is_explicit,
-          calculate_anyway,
-      ),
-      bootstrap_profile.I_bootstrap,
-      jnp.zeros_like(bootstrap_profile.I_bootstrap),
-  )
-  return source_profiles.BootstrapCurrentProfile(
-      sigma=sigma,
-      sigma_face=sigma_face,
-      j_bootstrap=j_bootstrap,
-      j_bootstrap_face=j_bootstrap_face,
-      I_bootstrap=I_bootstrap,
+      j_bootstrap_source,
+      dynamic_runtime_params_slice=dynamic_runtime_params_slice,
+      dynamic_source_runtime_params=dynamic_source_runtime_params,
+      geo=geo,
+      core_profiles=core_profiles,
+      zeros=source_profiles.BootstrapCurrentProfile.zero_profile(geo),
   )
 
 
@@ -249,18 +257,16 @@ def _build_psi_profiles(
     dynamic_source_runtime_params = dynamic_runtime_params_slice.sources[
         source_name
     ]
-    psi_profiles[source_name] = jax_utils.select(
+    psi_profiles[source_name] = _get_value_if(
         jnp.logical_or(
             explicit == dynamic_source_runtime_params.is_explicit,
             calculate_anyway,
         ),
-        source.get_value(
-            dynamic_runtime_params_slice,
-            dynamic_source_runtime_params,
-            geo,
-            core_profiles,
-        ),
-        jnp.zeros_like(geo.r),
+        source,
+        dynamic_runtime_params_slice=dynamic_runtime_params_slice,
+        dynamic_source_runtime_params=dynamic_source_runtime_params,
+        geo=geo,
+        core_profiles=core_profiles,
     )
   return psi_profiles
 
@@ -298,15 +304,13 @@ def _build_ne_profiles(
     dynamic_source_runtime_params = dynamic_runtime_params_slice.sources[
         source_name
     ]
-    ne_profiles[source_name] = jax_utils.select(
+    ne_profiles[source_name] = _get_value_if(
         explicit == dynamic_source_runtime_params.is_explicit,
-        source.get_value(
-            dynamic_runtime_params_slice,
-            dynamic_source_runtime_params,
-            geo,
-            core_profiles,
-        ),
-        jnp.zeros_like(geo.r),
+        source,
+        dynamic_runtime_params_slice=dynamic_runtime_params_slice,
+        dynamic_source_runtime_params=dynamic_source_runtime_params,
+        geo=geo,
+        core_profiles=core_profiles,
     )
   return ne_profiles
 
@@ -343,19 +347,16 @@ def _build_temp_ion_el_profiles(
       source_models.temp_ion_sources | source_models.temp_el_sources
   )
   for source_name, source in temp_ion_el_sources.items():
-    zeros = jnp.zeros(source.output_shape_getter(geo))
     dynamic_source_runtime_params = dynamic_runtime_params_slice.sources[
         source_name
     ]
-    ion_el_profiles[source_name] = jax_utils.select(
+    ion_el_profiles[source_name] = _get_value_if(
         explicit == dynamic_source_runtime_params.is_explicit,
-        source.get_value(
-            dynamic_runtime_params_slice,
-            dynamic_source_runtime_params,
-            geo,
-            core_profiles,
-        ),
-        zeros,
+        source,
+        dynamic_runtime_params_slice=dynamic_runtime_params_slice,
+        dynamic_source_runtime_params=dynamic_source_runtime_params,
+        geo=geo,
+        core_profiles=core_profiles,
     )
   return ion_el_profiles
 
@@ -17,7 +17,6 @@
 import dataclasses
 from absl.testing import absltest
 from absl.testing import parameterized
-import jax
 from jax import numpy as jnp
 import numpy as np
 from torax import core_profile_setters
@@ -121,6 +120,36 @@ class SourceTest(parameterized.TestCase):
     with self.assertRaises(TypeError):
       MySourceBuilder(my_field=1, runtime_params={})
 
+  def test_make_source_builder_returns_one_class_per_source(self):
+    """Tests that equivalent make_source_builder calls share one class."""
+
+    @dataclasses.dataclass(frozen=True, eq=True)
+    class MySource:
+      my_field: int
+
+    builder_type = source_lib.make_source_builder(MySource)
+    self.assertIs(source_lib.make_source_builder(MySource), builder_type)
+    # Spelling out the defaults, positionally or by keyword, gives the same
+    # class.
+    self.assertIs(
+        source_lib.make_source_builder(
+            MySource, runtime_params_lib.RuntimeParams, False
+        ),
+        builder_type,
+    )
+    self.assertIs(
+        source_lib.make_source_builder(
+            MySource,
+            links_back=False,
+            runtime_params_type=runtime_params_lib.RuntimeParams,
+        ),
+        builder_type,
+    )
+    self.assertIsNot(
+        source_lib.make_source_builder(MySource, runtime_params_type=int),
+        builder_type,
+    )
+
   def test_zero_profile_works_by_default(self):
     """The default source impl should support profiles with all zeros."""
     source_builder = source_lib.SourceBuilder(
@@ -191,7 +220,7 @@ class SourceTest(parameterized.TestCase):
         source_models=source_models,
     )
     # But calling requesting ZERO shouldn't work.
-    with self.assertRaises(jax.interpreters.xla.xe.XlaRuntimeError):
+    with self.assertRaises(ValueError):
       source.get_value(
           dynamic_runtime_params_slice=dynamic_runtime_params_slice,
           dynamic_source_runtime_params=dynamic_runtime_params_slice.sources[
@@ -327,6 +356,84 @@ class SourceTest(parameterized.TestCase):
     )
     np.testing.assert_allclose(profile, expected_output)
 
+  def test_concrete_mode_only_evaluates_selected_branch(self):
+    """With a concrete mode, the unselected profile function is never called."""
+
+    def unused_model(*unused_args):
+      raise AssertionError('model_func should not be called.')
+
+    def ones_formula(
+        unused_dcs,
+        unused_sc,
+        geo: geometry.Geometry,
+        unused_state,
+        unused_source_models,
+    ):
+      return jnp.ones_like(geo.r)
+
+    source_builder = source_lib.SourceBuilder(
+        output_shape_getter=source_lib.get_cell_profile_shape,
+        model_func=unused_model,
+        formula=ones_formula,
+        affected_core_profiles=(source_lib.AffectedCoreProfile.NE,),
+    )
+    source_builder.runtime_params.mode = runtime_params_lib.Mode.FORMULA_BASED
+    source_models_builder = source_models_lib.SourceModelsBuilder(
+        {'foo': source_builder},
+    )
+    source_models = source_models_builder()
+    source = source_models.sources['foo']
+    runtime_params = general_runtime_params.GeneralRuntimeParams()
+    geo = geometry.build_circular_geometry()
+    dynamic_runtime_params_slice = (
+        runtime_params_slice.build_dynamic_runtime_params_slice(
+            runtime_params,
+            sources=source_models_builder.runtime_params,
+            geo=geo,
+        )
+    )
+    profile = source.get_value(
+        dynamic_runtime_params_slice=dynamic_runtime_params_slice,
+        dynamic_source_runtime_params=dynamic_runtime_params_slice.sources[
+            'foo'
+        ],
+        geo=geo,
+    )
+    np.testing.assert_allclose(profile, np.ones_like(geo.r))
+
+  def test_concrete_out_of_range_mode_raises_error(self):
+    """A concrete mode outside of the Mode enum is rejected, not wrapped."""
+    source_builder = source_lib.SourceBuilder(
+        output_shape_getter=source_lib.get_cell_profile_shape,
+        affected_core_profiles=(source_lib.AffectedCoreProfile.NE,),
+    )
+    source_models_builder = source_models_lib.SourceModelsBuilder(
+        {'foo': source_builder},
+    )
+    runtime_params = general_runtime_params.GeneralRuntimeParams()
+    geo = geometry.build_circular_geometry()
+    dynamic_runtime_params_slice = (
+        runtime_params_slice.build_dynamic_runtime_params_slice(
+            runtime_params,
+            sources=source_models_builder.runtime_params,
+            geo=geo,
+        )
+    )
+    dynamic_source_runtime_params = dataclasses.replace(
+        dynamic_runtime_params_slice.sources['foo'], mode=-1
+    )
+    with self.assertRaises(ValueError):
+      source_lib.get_source_profiles(
+          dynamic_runtime_params_slice=dynamic_runtime_params_slice,
+          dynamic_source_runtime_params=dynamic_source_runtime_params,
+          geo=geo,
+          core_profiles=None,
+          model_func=None,
+          formula=None,
+          output_shape=source_lib.get_cell_profile_shape(geo),
+          source_models=None,
+      )
+
   def test_overriding_model(self):
     """The user-specified model should override the default model."""
     output_shape = (2, 4)  # Some arbitrary shape.
@@ -472,7 +579,7 @@ class SingleProfileSourceTest(parameterized.TestCase):
         # defaults are enough for this.
         source_models=source_models,
     )
-    with self.assertRaises(AssertionError):
+    with self.assertRaises(ValueError):
       source.get_value(
           dynamic_runtime_params_slice=dynamic_runtime_params_slice,
           dynamic_source_runtime_params=dynamic_runtime_params_slice.sources[
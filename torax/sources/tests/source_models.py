@@ -207,6 +207,83 @@ class SourceProfilesTest(parameterized.TestCase):
       np.testing.assert_allclose(ne, expected_ne)
       np.testing.assert_allclose(temp_el, expected_temp_el)
 
+  def test_sources_of_the_other_pass_output_zeros(self):
+    """Tests that sources skipped in this pass output zeros of their shape."""
+    source_name = 'foo'
+
+    def foo_formula(
+        unused_dcs,
+        unused_sc,
+        geo: geometry.Geometry,
+        unused_state,
+        unused_source_models,
+    ):
+      return jnp.ones(
+          (2,) + source_lib.ProfileType.CELL.get_profile_shape(geo)
+      )
+
+    foo_source_builder = source_lib.SourceBuilder(
+        affected_core_profiles=(
+            source_lib.AffectedCoreProfile.TEMP_ION,
+            source_lib.AffectedCoreProfile.TEMP_EL,
+        ),
+        supported_modes=(runtime_params_lib.Mode.FORMULA_BASED,),
+        output_shape_getter=(
+            lambda geo: (2,)
+            + source_lib.ProfileType.CELL.get_profile_shape(geo)
+        ),
+        formula=foo_formula,
+    )
+    foo_source_builder.runtime_params.mode = (
+        runtime_params_lib.Mode.FORMULA_BASED
+    )
+    source_models_builder = source_models_lib.SourceModelsBuilder(
+        {source_name: foo_source_builder},
+    )
+    source_models = source_models_builder()
+    runtime_params = torax.GeneralRuntimeParams()
+    geo = torax.build_circular_geometry()
+    dynamic_runtime_params_slice = (
+        runtime_params_slice.build_dynamic_runtime_params_slice(
+            runtime_params,
+            sources=source_models_builder.runtime_params,
+            geo=geo,
+        )
+    )
+    core_profiles = core_profile_setters.initial_core_profiles(
+        dynamic_runtime_params_slice=dynamic_runtime_params_slice,
+        geo=geo,
+        source_models=source_models,
+    )
+    output_shape = (2,) + source_lib.ProfileType.CELL.get_profile_shape(geo)
+    # Sources are implicit by default, so the explicit pass skips them.
+    explicit_profiles = source_models_lib.build_source_profiles(
+        dynamic_runtime_params_slice=dynamic_runtime_params_slice,
+        geo=geo,
+        core_profiles=core_profiles,
+        source_models=source_models,
+        explicit=True,
+    )
+    foo_profile = explicit_profiles.profiles[source_name]
+    self.assertEqual(foo_profile.shape, output_shape)
+    np.testing.assert_allclose(foo_profile, 0.0)
+    zero_bootstrap = source_profiles_lib.BootstrapCurrentProfile.zero_profile(
+        geo
+    )
+    for name, value in explicit_profiles.j_bootstrap.items():
+      self.assertEqual(value.shape, zero_bootstrap[name].shape)
+      np.testing.assert_allclose(value, 0.0)
+    implicit_profiles = source_models_lib.build_source_profiles(
+        dynamic_runtime_params_slice=dynamic_runtime_params_slice,
+        geo=geo,
+        core_profiles=core_profiles,
+        source_models=source_models,
+        explicit=False,
+    )
+    np.testing.assert_allclose(
+        implicit_profiles.profiles[source_name], np.ones(output_shape)
+    )
+
 
 if __name__ == '__main__':
   absltest.main()
@@ -152,7 +152,7 @@ class SingleProfileSourceTestCase(SourceTestCase):
           )
       )
       with self.subTest(unsupported_mode.name):
-        with self.assertRaises(jax.interpreters.xla.xe.XlaRuntimeError):
+        with self.assertRaises(ValueError):
           source.get_value(
               dynamic_runtime_params_slice=dynamic_runtime_params_slice,
               dynamic_source_runtime_params=dynamic_runtime_params_slice.sources[
@@ -236,7 +236,7 @@ class IonElSourceTestCase(SourceTestCase):
           )
       )
       with self.subTest(unsupported_mode.name):
-        with self.assertRaises(jax.interpreters.xla.xe.XlaRuntimeError):
+        with self.assertRaises(ValueError):
           source.get_value(
               dynamic_runtime_params_slice=dynamic_runtime_params_slice,
               dynamic_source_runtime_params=dynamic_runtime_params_slice.sources[
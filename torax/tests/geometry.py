@@ -55,6 +55,22 @@ class GeometryTest(parameterized.TestCase):
     with self.assertRaises(dataclasses.FrozenInstanceError):
       geo.dr_norm = 0.1
 
+  def test_circular_geometry_is_cached(self):
+    """Test that building the same circular geometry twice reuses the result."""
+    geo_0 = geometry.build_circular_geometry(nr=10, Rmaj=6.0)
+    geo_1 = geometry.build_circular_geometry(nr=10, Rmaj=6.0)
+    geo_2 = geometry.build_circular_geometry(nr=10, Rmaj=7.0)
+    self.assertIs(geo_0, geo_1)
+    self.assertIsNot(geo_0, geo_2)
+
+  def test_cached_circular_geometry_is_read_only(self):
+    """Test that the arrays of a cached circular geometry can't be changed."""
+    geo = geometry.build_circular_geometry(nr=10)
+    with self.assertRaises(ValueError):
+      geo.vpr[0] = 1.0
+    with self.assertRaises(ValueError):
+      geo.torax_mesh.face_centers[0] = 1.0
+
   def test_circular_geometry_can_be_input_to_jitted_function(self):
     """Test that a circular geometry can be input to a jitted function."""
 
@@ -193,6 +209,18 @@ class GeometryTest(parameterized.TestCase):
     np.testing.assert_allclose(geo.Rmaj, 6.7)
     np.testing.assert_allclose(geo.Rmin, 1.5)
 
+  def test_build_base_geometry_provider_from_circular(self):
+    """Test that a base provider only interpolates base Geometry attributes."""
+    geo_0 = geometry.build_circular_geometry(Rmaj=6.2, Rmin=2.0)
+    geo_1 = geometry.build_circular_geometry(Rmaj=7.2, Rmin=1.0)
+    provider = geometry.GeometryProvider.create_provider(
+        {0.: geo_0, 10.: geo_1})
+    geo = provider(5.)
+    self.assertIsInstance(geo, geometry.Geometry)
+    self.assertNotIsInstance(geo, geometry.CircularAnalyticalGeometry)
+    np.testing.assert_allclose(geo.Rmaj, 6.7)
+    np.testing.assert_allclose(geo.Rmin, 1.5)
+
 
 def face_to_cell(nr, face):
   cell = np.zeros(nr)
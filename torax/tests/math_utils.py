@@ -49,6 +49,23 @@ class MathUtilsTest(parameterized.TestCase):
 
     np.testing.assert_allclose(cumulative, ref)
 
+  @parameterized.parameters([
+      dict(seed=20221007),
+  ])
+  def test_gradient(self, seed):
+    """Test that gradient matches the numpy implementation."""
+    rng_use_y, rng_use_x = jax.random.split(jax.random.PRNGKey(seed))
+    del seed  # Make sure seed isn't accidentally re-used
+    y = jax.random.normal(rng_use_y, (20,))
+    # Nonuniform, monotonically increasing grid.
+    x = jax.numpy.cumsum(jax.random.uniform(rng_use_x, (20,)) + 0.1)
+
+    gradient = math_utils.gradient(y, x)
+
+    ref = np.gradient(y, x)
+
+    np.testing.assert_allclose(gradient, ref, rtol=1e-6)
+
 
 if __name__ == '__main__':
   absltest.main()